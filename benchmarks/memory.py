@@ -0,0 +1,61 @@
+#!usr/bin/env python3
+"""
+Memory benchmark of FancyTable. For several table sizes, records the peak
+memory allocated (with :mod:`tracemalloc`) while ingesting data into a table,
+while retrieving its ``data`` and while formatting it, as well as the table's
+own estimate from ``memory_usage(deep=True)``.
+
+Run from the repository root: ``python -m benchmarks.memory [sizes...]``
+"""
+import sys
+import tracemalloc
+from random import Random
+
+from fancytables import FancyTable, TableFormatter
+
+HEADERS = ["City name", "Area", "Population", "Annual Rainfall"]
+SIZES = [1_000, 10_000, 100_000]
+
+
+def make_rows(count: int) -> list:
+    r = Random(0)
+    return [["city%d" % i, r.randint(100, 6000), r.randint(10_000, 5_000_000),
+             round(r.gauss(700.0, 150.0), 1)] for i in range(count)]
+
+
+def peak(function, *args) -> tuple:
+    """Call the function and return its result and the peak memory it
+    allocated in bytes."""
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(count: int) -> list:
+    rows = make_rows(count)
+    table, ingestion = peak(lambda: FancyTable(headers=HEADERS, data=rows))
+    del rows
+    data, access = peak(lambda: table.data)
+    del data
+    text, rendering = peak(TableFormatter.Borderless, table)
+    del text
+    return [count] + [size / 1024 for size in (
+        ingestion, access, rendering, table.memory_usage(deep=True)["total"])]
+
+
+def main(argv: list) -> int:
+    sizes = [int(size) for size in argv] or SIZES
+    results = FancyTable(
+        "Rows", *({'title': title, 'content': "float", 'format': ".1f"}
+                  for title in ["Ingestion KiB", "Data access KiB",
+                                "Rendering KiB", "memory_usage KiB"]),
+        data=[measure(size) for size in sizes])
+    print(TableFormatter.Borderless(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,69 @@
+#!usr/bin/env python3
+"""
+Throughput benchmark of the command line interface. For several input sizes,
+records how many megabytes of input per second ``fancytables`` formats when
+reading CSV in windowed and exact mode and when reading JSON lines, as well
+as the throughput of just parsing the CSV input, which bounds the others.
+
+Run from the repository root: ``python -m benchmarks.throughput [rows...]``
+"""
+import csv
+import io
+import json
+import sys
+import time
+from random import Random
+
+from fancytables import FancyTable, TableFormatter
+from fancytables.__main__ import main as cli
+
+HEADERS = ["host", "time", "level", "message", "bytes"]
+SIZES = [10_000, 100_000]
+
+
+def make_rows(count: int) -> list:
+    r = Random(0)
+    return [["web%d" % r.randint(1, 40), "2024-01-01T00:%02d:%02d" % (i % 60, i % 60),
+             r.choice(["INFO", "WARN", "ERROR"]),
+             "request handled for /api/v%d/items" % r.randint(1, 3),
+             r.randint(10, 99999)] for i in range(count)]
+
+
+def throughput(text: str, function) -> float:
+    """Call the function with the text as a stream and return the megabytes
+    of text processed per second."""
+    start = time.perf_counter()
+    function(io.StringIO(text, newline=""))
+    return len(text.encode()) / (time.perf_counter() - start) / 1e6
+
+
+def run(argv: list) -> callable:
+    return lambda stdin: cli(argv, stdin=stdin, stdout=io.StringIO())
+
+
+def measure(count: int) -> list:
+    rows = make_rows(count)
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerows([HEADERS] + rows)
+    text = buffer.getvalue()
+    lines = "".join(json.dumps(dict(zip(HEADERS, row))) + "\n" for row in rows)
+    return [count, len(text) / 1e6,
+            throughput(text, lambda stdin: sum(1 for row in csv.reader(stdin))),
+            throughput(text, run([])),
+            throughput(text, run(["--exact"])),
+            throughput(lines, run(["-f", "jsonl"]))]
+
+
+def main(argv: list) -> int:
+    sizes = [int(size) for size in argv] or SIZES
+    results = FancyTable(
+        "Rows", *({'title': title, 'content': "float", 'format': ".1f"}
+                  for title in ["CSV MB", "Parsing MB/s", "Windowed MB/s",
+                                "Exact MB/s", "JSON lines MB/s"]),
+        data=[measure(size) for size in sizes])
+    print(TableFormatter.Borderless(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,173 @@
+#!usr/bin/env python3
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__package__)
+
+# aggregation functions supported by agg() and summarize()
+aggregations = ("count", "sum", "mean", "min", "max")
+
+
+def _numpy():
+    """Import numpy on first use; it is an optional dependency."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def column_index(headers: List[dict], column) -> int:
+    """Look up a column by its title or index."""
+    if isinstance(column, int):
+        if not -len(headers) <= column < len(headers):
+            raise KeyError(column)
+        return column % len(headers)
+    for index, header in enumerate(headers):
+        if header['title'] == column:
+            return index
+    raise KeyError(column)
+
+
+def parse_aggregations(headers: List[dict], specs: dict) -> List[tuple]:
+    """
+    Turn keyword arguments like ``sum="a", mean=["b", "c"]`` into a list of
+    (function, column index) pairs.
+    """
+    result = []
+    for func, columns in specs.items():
+        if func not in aggregations:
+            raise ValueError("Unknown aggregation " + repr(func) +
+                             ", use one of " + ", ".join(aggregations))
+        if isinstance(columns, (str, int)):
+            columns = [columns]
+        result.extend((func, column_index(headers, column))
+                      for column in columns)
+    return result
+
+
+def aggregate(rows: iter, keys: List[int], specs: List[tuple]):
+    """
+    Aggregate the rows in a single pass. Returns a dict that maps each group
+    key (a tuple of the key column values) to the list of aggregated values
+    in the order of ``specs``. Groups keep the order of their first row.
+
+    Cells that are None are skipped, as are cells that can't be added up for
+    ``sum`` and ``mean`` (such as strings in a number column) or compared to
+    the others for ``min`` and ``max``. Float columns are reduced with
+    numpy if it is installed.
+    """
+    groups: Dict[tuple, int] = {}
+    codes = []
+    columns = sorted({column for func, column in specs})
+    values = {column: [] for column in columns}
+    for row in rows:
+        key = tuple(row[k] for k in keys)
+        codes.append(groups.setdefault(key, len(groups)))
+        for column in columns:
+            values[column].append(row[column] if column < len(row) else None)
+
+    reduced = {column: _reduce(codes, values[column], len(groups),
+                               {func for func, col in specs if col == column})
+               for column in columns}
+    return {key: [reduced[column][func][code] for func, column in specs]
+            for key, code in groups.items()}
+
+
+def _reduce(codes: list, values: list, count: int, funcs: set) -> dict:
+    np = _numpy()
+    # only pure float columns are vectorized: integers could overflow int64
+    # and mixed columns would turn their integers into floats
+    if np is not None and codes and all(isinstance(value, float)
+                                        for value in values):
+        return _reduce_numpy(np, codes, np.asarray(values, dtype=float),
+                             count, funcs)
+    return _reduce_python(codes, values, count, funcs)
+
+
+def _reduce_numpy(np, codes: list, array, count: int, funcs: set) -> dict:
+    codes = np.asarray(codes)
+    # sort the values by group so each group is one contiguous slice
+    order = np.argsort(codes, kind="stable")
+    starts = np.searchsorted(codes[order], np.arange(count))
+    ordered = array[order]
+    counts = np.bincount(codes, minlength=count)
+    result = {"count": counts.tolist()}
+    if funcs & {"sum", "mean"}:
+        sums = np.add.reduceat(ordered, starts)
+        result["sum"] = sums.tolist()
+        result["mean"] = (sums / counts).tolist()
+    if "min" in funcs:
+        result["min"] = np.minimum.reduceat(ordered, starts).tolist()
+    if "max" in funcs:
+        result["max"] = np.maximum.reduceat(ordered, starts).tolist()
+    return result
+
+
+def _reduce_python(codes: list, values: list, count: int, funcs: set) -> dict:
+    counts = [0] * count
+    sums = [0] * count
+    # number of cells that went into each sum
+    terms = [0] * count
+    mins = [None] * count
+    maxs = [None] * count
+    for code, value in zip(codes, values):
+        if value is None:
+            continue
+        counts[code] += 1
+        if "sum" in funcs or "mean" in funcs:
+            try:
+                sums[code] += value
+                terms[code] += 1
+            except TypeError:
+                pass
+        try:
+            if "min" in funcs and (mins[code] is None or value < mins[code]):
+                mins[code] = value
+            if "max" in funcs and (maxs[code] is None or value > maxs[code]):
+                maxs[code] = value
+        except TypeError:
+            pass
+    return {"count": counts,
+            "sum": sums,
+            "mean": [s / t if t else None for s, t in zip(sums, terms)],
+            "min": mins,
+            "max": maxs}
+
+
+class GroupBy:
+    """
+    Rows of a :class:`fancytables.FancyTable` grouped by the values of one or
+    more key columns, as returned by :func:`fancytables.FancyTable.group_by`.
+    Call :func:`fancytables.GroupBy.agg` to compute the aggregated table.
+    """
+
+    def __init__(self, table_type, headers: List[dict], rows, keys: list):
+        self.__table_type = table_type
+        self.__headers = headers
+        self.__rows = rows
+        self.__keys = [column_index(headers, key) for key in keys]
+
+    def agg(self, **specs):
+        """
+        Aggregate the groups into a new table, which has one row per group.
+        Its first columns are the key columns, marked as important, followed
+        by one column per aggregation, titled like ``"sum(Area)"``.
+
+        Every keyword names an aggregation function (one of ``count``,
+        ``sum``, ``mean``, ``min`` and ``max``) and maps it to a column title
+        or index, or a list of them. Example: ::
+            table.group_by("Country").agg(sum="Population", mean=["Area", "Rainfall"])
+
+        All aggregations are computed in a single pass over the table.
+        """
+        specs = parse_aggregations(self.__headers, specs)
+        headers = [dict(self.__headers[key], important=True)
+                   for key in self.__keys]
+        headers += [{'title': func + "(" + self.__headers[column]['title'] + ")",
+                     'important': False} for func, column in specs]
+        result = aggregate(self.__rows, self.__keys, specs)
+        logger.debug("Aggregated %d groups", len(result))
+        return self.__table_type(headers=headers,
+                                 data=[list(key) + values
+                                       for key, values in result.items()])
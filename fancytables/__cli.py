@@ -0,0 +1,219 @@
+#!usr/bin/env python3
+"""
+Command line interface of fancytables. Reads CSV, TSV or JSON lines from
+standard input and writes them as a formatted table to standard output.
+
+There are two modes of operation:
+
+- **windowed** (default): Column widths are determined from the first
+  ``--window`` rows (or fixed with ``--width``), after which all rows are
+  streamed through the formatter. Memory use is bounded by the window size.
+- **exact** (``--exact``): The input is read once to determine exact column
+  widths while spilling rows to a temporary file, which is then read back and
+  formatted. Memory use is bounded by ``--window`` as well, but the whole
+  input is stored on disk.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+from itertools import chain, islice
+
+from .__fancytable import FancyTable
+from .__formatters import TableFormatter
+
+# csv dialects of the delimited input formats
+_DIALECTS = {"csv": "excel", "tsv": "excel-tab"}
+# the largest csv field size that fits into a C long on all platforms; the
+# default of 128 KiB is easily exceeded by single log records
+_FIELD_SIZE_LIMIT = min(sys.maxsize, 2 ** 31 - 1)
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="fancytables",
+        description="Format CSV, TSV or JSON lines from stdin as a table.")
+    parser.add_argument("-f", "--format", choices=["csv", "tsv", "jsonl"],
+                        default="csv", help="input format (default: csv)")
+    parser.add_argument("--no-header", action="store_true",
+                        help="the first row is data; columns are numbered. "
+                        "JSON objects always use their keys as headers")
+    parser.add_argument("--exact", action="store_true",
+                        help="determine exact column widths in a first pass "
+                        "over the input, spilling rows to a temporary file")
+    parser.add_argument("-w", "--window", type=int, default=1000,
+                        help="number of rows held in memory at once, which "
+                        "determine the column widths in windowed mode "
+                        "(default: 1000)")
+    parser.add_argument("--width", type=int, default=None,
+                        help="fixed width of all columns; disables sampling")
+    parser.add_argument("-a", "--align", choices=["l", "r", "c"], default=None,
+                        help="align all columns left, right or centered")
+    parser.add_argument("-o", "--overflow", choices=TableFormatter.overflow_policies,
+                        default=None, help="what to do with cells wider than "
+                        "their column in windowed mode (default: misalign row)")
+    return parser
+
+
+class _InputError(ValueError):
+    """Raised for input that can't be formatted as a table."""
+
+
+def _read_rows(stream, fmt: str) -> iter:
+    if fmt == "jsonl":
+        return _read_json_lines(stream)
+    csv.field_size_limit(_FIELD_SIZE_LIMIT)
+    return csv.reader(stream, _DIALECTS[fmt])
+
+
+def _read_json_lines(stream) -> iter:
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            raise _InputError("line %d: %s" % (number, error))
+
+
+def _checked(rows: iter, kind: type) -> iter:
+    """Make sure all rows are of the same JSON type as the first one."""
+    for row in rows:
+        if not isinstance(row, kind):
+            raise _InputError("expected all rows to be JSON %s, got %s" % (
+                "objects" if kind is dict else "arrays", json.dumps(row)))
+        yield row
+
+
+def _write_rows(stream, fmt: str, rows: iter):
+    if fmt == "jsonl":
+        stream.writelines(json.dumps(row) + "\n" for row in rows)
+    else:
+        csv.writer(stream, _DIALECTS[fmt]).writerows(rows)
+
+
+def _split_headers(rows: iter, no_header: bool, json_rows: bool):
+    """
+    Return the header titles and an iterator over the remaining rows. JSON
+    rows are checked and cleaned up, csv rows are always lists of strings.
+    """
+    first = next(rows, None)
+    if first is None:
+        return [], iter(())
+    if isinstance(first, dict):
+        keys = list(first)
+        return keys, ([_cell(obj.get(key)) for key in keys]
+                      for obj in _checked(chain((first,), rows), dict))
+    if json_rows:
+        if not isinstance(first, list):
+            raise _InputError("expected JSON objects or arrays, got " +
+                              json.dumps(first))
+        first = [_cell(value) for value in first]
+        rows = ([_cell(value) for value in row] for row in _checked(rows, list))
+    if no_header:
+        return [str(i) for i in range(1, len(first) + 1)], chain((first,), rows)
+    return [str(title) for title in first], rows
+
+
+def _cell(value):
+    return "" if value is None else value
+
+
+def _chunks(rows: iter, size: int) -> iter:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_lines(stdout, lines: iter):
+    stdout.writelines(line + "\n" for line in lines)
+
+
+def _format_lines(formatter, headers: list, rows: iter, args) -> iter:
+    """
+    Format the rows like ``formatter.format_rows``. Csv rows only consist of
+    strings in unimportant columns, so unless cells need to be fitted to
+    their columns, each line is a plain join of the justified cells, which
+    skips the formatter's per-cell work.
+    """
+    if args.format == "jsonl" or args.overflow is not None or \
+            type(formatter) is not type(TableFormatter.Borderless):
+        yield from formatter.format_rows(headers, rows)
+        return
+    # the header line may widen columns for their titles
+    yield from formatter.format_rows(headers, ())
+    justify = {"r": str.rjust, "c": str.center}.get(formatter.align, str.ljust)
+    widths = [header['width'] for header in headers]
+    for row in rows:
+        yield "  ".join(map(justify, row, widths)).rstrip()
+
+
+def _format_windowed(formatter, titles: list, rows: iter, args, stdout):
+    window = list(islice(rows, args.window))
+    table = FancyTable(headers=titles, data=window)
+    if args.width is not None:
+        widths = [args.width] * len(titles)
+    else:
+        widths = formatter.column_widths(table)
+    headers = formatter.formatter_headers(table.headers, widths)
+    _write_lines(stdout, _format_lines(formatter, headers, chain(window, rows),
+                                       args))
+
+
+def _format_exact(formatter, titles: list, rows: iter, args, stdout):
+    headers = FancyTable(headers=titles).headers
+    widths = TableFormatter.determine_widths(headers, ())
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as spill:
+        for chunk in _chunks(rows, args.window):
+            widths = list(map(max, widths,
+                              TableFormatter.determine_widths(headers, chunk)))
+            _write_rows(spill, args.format, chunk)
+        spill.seek(0)
+        headers = formatter.formatter_headers(headers, widths)
+        _write_lines(stdout, _format_lines(
+            formatter, headers, _read_rows(spill, args.format), args))
+
+
+def main(argv: list = None, stdin=None, stdout=None) -> int:
+    """
+    Entry point of the ``fancytables`` console script and of
+    ``python -m fancytables``.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.window <= 0:
+        parser.error("--window must be positive")
+    if stdin is None:
+        # csv needs the raw line endings to handle quoted newlines correctly
+        stdin = io.TextIOWrapper(sys.stdin.buffer, encoding=sys.stdin.encoding,
+                                 newline="")
+    if stdout is None:
+        stdout = sys.stdout
+
+    formatter = TableFormatter.Borderless
+    if args.align is not None or args.overflow is not None:
+        formatter = type(formatter)(align=args.align, overflow=args.overflow)
+
+    try:
+        titles, rows = _split_headers(_read_rows(stdin, args.format),
+                                      args.no_header, args.format == "jsonl")
+        if not titles:
+            return 0
+        if args.exact:
+            _format_exact(formatter, titles, rows, args, stdout)
+        else:
+            _format_windowed(formatter, titles, rows, args, stdout)
+        stdout.flush()
+    except (_InputError, csv.Error, UnicodeDecodeError) as error:
+        stdout.flush()
+        parser.error(str(error))
+    except BrokenPipeError:
+        # the reader went away (e.g. ``| head``); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
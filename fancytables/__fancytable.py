@@ -1,11 +1,19 @@
 #!usr/bin/env python3
 import copy
+import heapq
 import logging
-from itertools import islice
+import struct
+import sys
+from itertools import chain, islice
 from numbers import Number
+from operator import itemgetter
 from typing import List
 
+from .__aggregate import GroupBy, aggregate, column_index, parse_aggregations
 from .__formatters import TableFormatter
+from .__live import LiveRenderer
+from .__memory import deep_sizeof
+from .__rowstore import RowStore
 
 logger = logging.getLogger(__package__)
 
@@ -77,6 +85,14 @@ class FancyTable:
                 - **important** (bool): state whether this column is important.
                   All builtin table formatters use this to highlight the column
                   and custom implementations are encouraged to do so.
+                - **content** (str): the type of the column's values, such as
+                  "int" or "float". Formatters use this to determine column
+                  widths without formatting every value, see
+                  :func:`fancytables.TableFormatter.bound_width`.
+                - **format** (str): a
+                  `format spec <https://docs.python.org/library/string.html#formatspec>`_
+                  used by the builtin formatters to convert the column
+                  elements to text, e.g. ".2f".
 
         Instead of using the keyword argument, you can also pass in the header
         elements individually through positional arguments (see first example),
@@ -85,14 +101,20 @@ class FancyTable:
     :param data: Initial data to be inserted into the table. See
         :class:`fancytables.FancyTable.__add__` for information on possible
         data
+
+    :param capacity: The maximum number of rows. Once it is exceeded, the
+        oldest rows are dropped, which makes the table a ring buffer of the
+        most recent rows. By default, the table can grow indefinitely.
     """
 
-    def __init__(self, *args, headers: list = None, data: iter = None):
+    def __init__(self, *args, headers: list = None, data: iter = None,
+                 capacity: int = None):
         #logger.debug("Table initialized, positional arguments: %s", str(args))
         self.__headers = self.__parse_headers(
             headers if headers is not None else args)
-        self.__data = self.__parse_data(
-            self.__headers, data if data is not None else [])
+        self.__data = RowStore(self.__parse_data(
+            self.__headers, data if data is not None else []), capacity)
+        self.__summaries = []
         # logger.debug(str(self.__data) + str(self.__headers))
 
     def __format__(self, format_spec):
@@ -147,12 +169,14 @@ class FancyTable:
         """Utility method to change all entries in the headers list into a dict."""
         # mapper function for headers
         def mapheader(header):
-            try:
-                return dict(header)
-            except ValueError:
-                return {"title": str(header),
-                        "important": False}
-            return None
+            # strings are always titles, even if dict() would accept them
+            if not isinstance(header, str):
+                try:
+                    return dict(header)
+                except (TypeError, ValueError):
+                    pass
+            return {"title": str(header),
+                    "important": False}
 
         return list(filter(lambda x: x is not None,
                            map(mapheader, headers)))
@@ -238,7 +262,7 @@ class FancyTable:
         data. The data retrieved is always deeply copied (see
         `copy.deepcopy() <https://docs.python.org/library/copy.html#copy.deepcopy>`_)
         """
-        return copy.deepcopy(self.__data.copy())
+        return copy.deepcopy(list(self.__data))
 
     @data.setter
     def data(self, data):
@@ -247,7 +271,9 @@ class FancyTable:
         data. The data retrieved is always deeply copied (see
         `copy.deepcopy() <https://docs.python.org/library/copy.html#copy.deepcopy>`_)
         """
-        self.__data = self.__parse_data(self.__headers, data)
+        # refill the store instead of replacing it to keep row versions unique
+        self.__data.clear()
+        self.__data.extend(self.__parse_data(self.__headers, data))
 
     @data.deleter
     def data(self):
@@ -256,7 +282,280 @@ class FancyTable:
         data. The data retrieved is always deeply copied (see
         `copy.deepcopy() <https://docs.python.org/library/copy.html#copy.deepcopy>`_)
         """
-        self.__data = []
+        self.__data.clear()
+
+    @property
+    def capacity(self) -> int:
+        """
+        The maximum number of rows, or None if there is no limit. Lowering the
+        capacity drops the oldest rows that exceed it.
+        """
+        return self.__data.capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int):
+        self.__data.capacity = capacity
+
+    def drop_head(self, count: int):
+        """Remove the first ``count`` rows in O(count) amortized time."""
+        if count < 0:
+            raise ValueError("Cannot remove a negative amount of rows.")
+        self.__data.drop_head(count)
+
+    def keep_last(self, count: int):
+        """Remove all but the last ``count`` rows."""
+        if count < 0:
+            raise ValueError("Cannot keep a negative amount of rows.")
+        self.__data.drop_head(len(self.__data) - count)
+
+    @property
+    def footers(self):
+        """
+        The footer summary rows added with
+        :func:`fancytables.FancyTable.summarize`. They are computed from the
+        current data on every access; delete this property to remove them.
+        """
+        if not self.__summaries:
+            return []
+        result = aggregate(self.__data, [], self.__summaries).get(())
+        if result is None:
+            # no rows at all, which sum up like a column of None cells
+            result = [0 if func in ("count", "sum") else None
+                      for func, column in self.__summaries]
+        footers = {}
+        for (func, column), value in zip(self.__summaries, result):
+            footers.setdefault(func, [""] * len(self.__headers))[column] = \
+                "" if value is None else value
+        for func, row in footers.items():
+            if all(column != 0 for f, column in self.__summaries if f == func):
+                row[0] = func
+        return list(footers.values())
+
+    @footers.deleter
+    def footers(self):
+        self.__summaries = []
+
+    def summarize(self, **aggregations):
+        """
+        Add footer summary rows to the table, one per aggregation function.
+        Each row holds the function's result below the aggregated columns and
+        is labeled with the function name in the first column, unless that
+        column is aggregated itself. See :func:`fancytables.GroupBy.agg` for
+        the possible keyword arguments. Example: ::
+            table.summarize(sum=["Area", "Population"], mean="Annual Rainfall")
+
+        The summaries are recomputed in a single pass over the data whenever
+        the ``footers`` are accessed, e.g. when formatting the table. Cells
+        that can't be aggregated, such as strings in a sum, are skipped. If no
+        cells are left, ``count`` and ``sum`` are 0 and the other results are
+        empty.
+        """
+        self.__summaries.extend(parse_aggregations(self.__headers, aggregations))
+
+    def group_by(self, *columns) -> GroupBy:
+        """
+        Group the table's rows by the values of the given key columns, given
+        by title or index. Use :func:`fancytables.GroupBy.agg` on the result
+        to compute a table of aggregated values per group. Example: ::
+            table.group_by("Country").agg(count="City", sum="Population")
+        """
+        if not columns:
+            raise ValueError("group_by needs at least one key column")
+        return GroupBy(type(self), self.__headers, self.__data, columns)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """
+        Estimate the memory used by the table in bytes. The result maps:
+
+        - **columns** to a dict of the memory per column title. This includes
+          a pointer per row and, if ``deep`` is true, the cell values
+          themselves including the contents of nested lists, tuples, sets and
+          dicts. Objects shared between cells, such as small integers or
+          repeated strings, are only counted once.
+        - **rows** to the memory of the row store and of the row lists, except
+          for the cell pointers.
+        - **versions** to the memory of the row versions (see
+          :func:`fancytables.FancyTable.row_versions`).
+        - **headers** to the memory of the header dicts, with their contents
+          if ``deep`` is true.
+        - **summaries** to the memory of the footer summary definitions.
+        - **total** to the sum of all of the above.
+
+        Computing the deep memory usage visits every cell, so it takes about
+        as long as formatting the table.
+        """
+        pointer = struct.calcsize("P")
+        seen = set()
+        store = self.__data.memory_usage()
+        columns = [0] * len(self.__headers)
+        rows = store["rows"]
+        for row in self.__data:
+            rows += sys.getsizeof(row)
+            for index, cell in enumerate(row[:len(columns)]):
+                columns[index] += pointer
+                if deep:
+                    columns[index] += deep_sizeof(cell, seen)
+            rows -= pointer * min(len(row), len(columns))
+        if deep:
+            headers = deep_sizeof(self.__headers, seen)
+        else:
+            headers = sys.getsizeof(self.__headers) + \
+                sum(map(sys.getsizeof, self.__headers))
+        result = {"columns": {},
+                  "rows": rows,
+                  "versions": store["versions"],
+                  "headers": headers,
+                  "summaries": deep_sizeof(self.__summaries, set())}
+        for header, size in zip(self.__headers, columns):
+            result["columns"][header['title']] = \
+                result["columns"].get(header['title'], 0) + size
+        result["total"] = sum(columns) + rows + store["versions"] + headers \
+            + result["summaries"]
+        return result
+
+    @staticmethod
+    def __check_compatible(tables: list):
+        if not tables:
+            raise ValueError("At least one table is required.")
+        titles = [header['title'] for header in tables[0].__headers]
+        for table in tables[1:]:
+            if [header['title'] for header in table.__headers] != titles:
+                raise ValueError("Incompatible headers: " + str(titles) + " and "
+                                 + str([h['title'] for h in table.__headers]))
+
+    @staticmethod
+    def concat_rows(tables: list) -> iter:
+        """
+        Lazily iterate over the rows of all tables, one table after another.
+        The tables must have the same header titles. The rows are not copied,
+        so they must not be modified. This can be fed directly into
+        :func:`fancytables.TableFormatter.format_rows` to format the
+        concatenation without creating it.
+        """
+        tables = list(tables)
+        FancyTable.__check_compatible(tables)
+        return chain.from_iterable(table.__data for table in tables)
+
+    @staticmethod
+    def merge_sorted_rows(tables: list, key, reverse: bool = False) -> iter:
+        """
+        Lazily merge the rows of tables that are each sorted by ``key`` into
+        one sorted sequence of rows, using a k-way merge that only holds one
+        row per table at a time. The key is a column title or index, or a
+        function that computes the sort key from a row. As with
+        :func:`fancytables.FancyTable.concat_rows`, the rows are not copied.
+        """
+        tables = list(tables)
+        FancyTable.__check_compatible(tables)
+        if not callable(key):
+            key = itemgetter(column_index(tables[0].__headers, key))
+        return heapq.merge(*(table.__data for table in tables),
+                           key=key, reverse=reverse)
+
+    @classmethod
+    def concat(cls, tables: list):
+        """
+        Create a new table holding the rows of all tables, one table after
+        another, which is much cheaper than adding them up with ``+``. The
+        tables must have the same header titles; the headers of the first
+        table are used.
+        """
+        tables = list(tables)
+        return cls.__combine(tables, FancyTable.concat_rows(tables))
+
+    @classmethod
+    def merge_sorted(cls, tables: list, key, reverse: bool = False):
+        """
+        Create a new table holding the rows of tables that are each sorted by
+        ``key``, merged in sorted order. See
+        :func:`fancytables.FancyTable.merge_sorted_rows` for the arguments.
+        """
+        tables = list(tables)
+        return cls.__combine(tables, FancyTable.merge_sorted_rows(
+            tables, key, reverse))
+
+    @classmethod
+    def __combine(cls, tables: list, rows: iter):
+        table = cls(headers=copy.deepcopy(tables[0].__headers))
+        # copy row by row straight into the new table's only row list
+        table.__data = RowStore(map(copy.deepcopy, rows))
+        return table
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __getitem__(self, index):
+        """
+        Retrieve a single row of the table by its index, or a new table with
+        the rows of a slice. Like the ``data`` property, the returned rows are
+        deeply copied.
+        """
+        if isinstance(index, slice):
+            return self.__derive(self.__data[index])
+        return copy.deepcopy(self.__data[index])
+
+    def __setitem__(self, index, row):
+        """
+        Replace a single row, e.g. ``table[3] = ["a", "b", "c"]``. The row
+        gets a new version, see :func:`fancytables.FancyTable.row_versions`.
+        """
+        if isinstance(index, slice):
+            self.__data[index] = self.__parse_data(self.__headers, row)
+        else:
+            self.__data[index] = list(row)
+
+    def set_cell(self, row: int, column, value):
+        """
+        Replace a single cell's value. The column can be given by title or
+        index. Like all row modifications, this gives the row a new version.
+        """
+        cells = list(self.__data[row])
+        cells[column_index(self.__headers, column)] = value
+        self.__data[row] = cells
+
+    def iter_rows(self) -> iter:
+        """
+        Iterate over the rows without copying them, which makes this the
+        cheapest way of reading a large table, e.g. for streaming it to a
+        formatter with :func:`fancytables.TableFormatter.lines`. Unlike the
+        rows of ``data``, these rows must not be modified, and the table must
+        not be modified while iterating.
+        """
+        return iter(self.__data)
+
+    @property
+    def row_versions(self) -> List[int]:
+        """
+        The version stamps of all rows in row order. A row's version changes
+        whenever the row is replaced or modified, and versions are never
+        reused within a table. Comparing versions is a cheap way of finding
+        the rows that changed, as done by
+        :class:`fancytables.LiveRenderer`.
+        """
+        return self.__data.versions
+
+    def live(self, formatter=None) -> LiveRenderer:
+        """
+        Create a :class:`fancytables.LiveRenderer` for displaying this table
+        in a terminal while it is being updated.
+        """
+        return LiveRenderer(self, formatter)
+
+    def __delitem__(self, index):
+        """
+        Delete a single row or a slice of rows, e.g. ``del table[10:20]``.
+        Deleting from the start or the end of the table only takes time
+        proportional to the number of deleted rows.
+        """
+        del self.__data[index]
+
+    def __derive(self, rows: list):
+        """Create a copy of this table that holds copies of the given rows."""
+        table = copy.copy(self)
+        table.__headers = copy.deepcopy(self.__headers)
+        table.__summaries = list(self.__summaries)
+        table.__data = RowStore(copy.deepcopy(rows), self.__data.capacity)
+        return table
 
     def __add__(self, other):
         """
@@ -288,6 +587,15 @@ class FancyTable:
             raise te
         return newtable
 
+    def __iadd__(self, other):
+        """
+        In-place variant of :func:`fancytables.FancyTable.__add__`, used by
+        ``table += data``. The rows are appended to this table instead of a
+        copy, so appending a row doesn't copy the whole table.
+        """
+        self.__data.extend(FancyTable.__parse_data(self.__headers, other))
+        return self
+
     def __sub__(self, other):
         '''
         Magic method for overriding the subtraction operator.
@@ -300,9 +608,7 @@ class FancyTable:
         if other <= 0:
             raise ValueError(
                 "Cannot remove negative or zero amount of data from FancyTable.")
-        newtable = copy.deepcopy(self)
-        newtable.__data = newtable.__data[:-int(other)]
-        return newtable
+        return self.__derive(self.__data[:max(len(self.__data) - int(other), 0)])
 
     def __str__(self):
         if len(self.__data) > 10:
@@ -1,8 +1,10 @@
 #!usr/bin/env python3
 import logging
 from copy import deepcopy
-from typing import List
-from itertools import chain
+from math import isnan
+from numbers import Number, Real
+from typing import Iterator, List
+from itertools import chain, repeat, zip_longest
 
 from .__const import default_formatter_header
 
@@ -27,11 +29,36 @@ class TableFormatter:
                      do not override the __call__ method.
     :param align:    How to align ALL columns: left "l", right "r" or center
                      "c". This option must be processed by the children.
+    :param overflow: What to do with cells that are wider than their column,
+                     which happens if widths were estimated (see
+                     :func:`fancytables.TableFormatter.estimate_widths`) or
+                     fixed: "truncate" them, "mark" them by truncating and
+                     appending an ellipsis, or "widen" the column for all
+                     following rows. Lines that were already output are not
+                     reflowed. By default, cells are output as they are and
+                     the row is misaligned. This option must be processed by
+                     the children, see
+                     :func:`fancytables.TableFormatter.fit_cell`.
+    :param sample_size: Estimate the column widths from a random sample of at
+                     most this many rows instead of measuring every row (see
+                     :func:`fancytables.TableFormatter.estimate_widths`), so
+                     that formatting starts in constant time regardless of the
+                     table size. Combine it with an ``overflow`` policy to
+                     keep rows aligned.
     """
 
-    def __init__(self, inverted: bool = False, align: str = None):
+    overflow_policies = ("truncate", "mark", "widen")
+
+    def __init__(self, inverted: bool = False, align: str = None,
+                 overflow: str = None, sample_size: int = None):
+        if overflow is not None and overflow not in self.overflow_policies:
+            raise ValueError("Unknown overflow policy " + repr(overflow))
+        if sample_size is not None and sample_size <= 0:
+            raise ValueError("Sample size must be positive.")
         self.inverted = inverted
         self.align = align
+        self.overflow = overflow
+        self.sample_size = sample_size
 
     def __call__(self, table):
         """
@@ -48,22 +75,15 @@ class TableFormatter:
         # warning: this is python at its finest, be prepared to be amazed of
         # how terrible I use all of this language's amazing features
 
-        # prepare minimum width
-        # oh fuck yes python this is awesome
-        min_widths = map(lambda elts:
-                         (lambda header, *col:
-                          TableFormatter.determine_width(
-                              chain((header['title']), col))
-                          )(*elts),  # use hack to spread arguments with nested lambda
-                         # zip headers and data transposed
-                         zip(table.headers, *table.data)
-                         )
-        # logger.debug(" ".join(map(lambda x: str(x), min_widths)))
-
         cf = self.column_format(
             [], default_formatter_header, 0)
         if cf is not NotImplemented:
             logger.debug("Using column format method")
+            # read the rows and footers once, as both can be expensive to get
+            rows = table.data
+            footers = list(getattr(table, 'footers', ()))
+            # prepare minimum width
+            min_widths = self.column_widths(table, rows, footers)
 
             def column_creator(args):
                 # logger.debug(args)
@@ -78,7 +98,7 @@ class TableFormatter:
                 return self.column_format(col, header, pos)
 
             column_list = map(column_creator, zip(
-                table.headers, min_widths, *table.data))
+                table.headers, min_widths, *rows, *footers))
 
             # logger.debug(list(column_list))
             return "\n".join(("".join(tup) for tup in zip(*column_list)))
@@ -88,16 +108,7 @@ class TableFormatter:
             # use row format method
             logger.debug("Using row format method")
 
-            def formatter_headers():
-                nonlocal min_widths
-                for header, min_width in zip(table.headers, min_widths):
-                    header['width'] = min_width
-                    yield header
-
-            row_list = map(
-                lambda row: self.row_format(row, formatter_headers()),
-                chain(deepcopy(table.headers), table.data))
-            return "\n".join(row_list)
+            return "\n".join(self.lines(table))
 
     def get_border(self, top: bool = False, right: bool = False, bottom: bool = False, left: bool = False) -> str:
         """
@@ -175,6 +186,210 @@ class TableFormatter:
         '''
         return NotImplemented
 
+    def lines(self, table) -> Iterator[str]:
+        """
+        Lazily format a table line by line using
+        :func:`fancytables.TableFormatter.row_format`, which is what
+        :func:`fancytables.TableFormatter.__call__` joins together. Rows are
+        read with the table's ``iter_rows`` method if it has one, so they are
+        not copied; otherwise its ``data`` is used.
+
+        If the formatter has a ``sample_size``, the first line is available
+        as soon as the widths are estimated from a sample. Otherwise all rows
+        are measured first, in a separate pass over the table. Either way, the
+        table must not be modified until all lines are consumed.
+        """
+        footers = list(getattr(table, 'footers', ()))
+        iter_rows = getattr(table, 'iter_rows', None)
+        if iter_rows is None:
+            rows = table.data
+        else:
+            rows = iter_rows()
+        if self.sample_size is not None:
+            widths = list(map(max, self.estimate_widths(table, self.sample_size),
+                              TableFormatter.determine_widths(table.headers,
+                                                              footers)))
+        elif iter_rows is None:
+            widths = self.column_widths(table, rows, footers)
+        else:
+            widths = self.column_widths(table, iter_rows(), footers)
+        return self.format_rows(self.formatter_headers(table.headers, widths),
+                                rows, footers)
+
+    def format_rows(self, headers: List[dict], rows: iter,
+                    footers: iter = ()) -> Iterator[str]:
+        """
+        Lazily format a header line followed by one line per row using
+        :func:`fancytables.TableFormatter.row_format`. Because rows are only
+        pulled from ``rows`` as lines are requested, this can be used to
+        stream tables of arbitrary length with fixed column widths.
+
+        :param headers: All *Formatter Header* s of the table, i.e. including
+                        their ``width``.
+        :param rows:    Any iterable of rows, such as a table's ``data`` or a
+                        generator.
+        :param footers: Rows that are formatted after all other rows, such as
+                        a table's ``footers``.
+
+        The header titles are formatted like a row, but without the columns'
+        ``formatter`` and ``format`` options, which only apply to values.
+        """
+        header_row = []
+        title_headers = []
+        for header in headers:
+            title = self.header_format(header)
+            header_row.append(header['title'] if title is NotImplemented
+                              else title)
+            title_headers.append({key: value for key, value in header.items()
+                                  if key not in ("formatter", "format")})
+        yield self.row_format(header_row, title_headers)
+        # keep columns that were widened for their title
+        for header, title_header in zip(headers, title_headers):
+            header['width'] = title_header['width']
+        for row in chain(rows, footers):
+            yield self.row_format(row, headers)
+
+    def fit_cell(self, header: dict, text: str) -> str:
+        """
+        Apply the ``overflow`` policy to a cell's text if it is wider than
+        its column. With the "widen" policy, the *Formatter Header* 's
+        ``width`` is increased, which affects all following rows.
+        """
+        width = header['width']
+        if len(text) <= width or self.overflow is None:
+            return text
+        if self.overflow == "widen":
+            header['width'] = len(text)
+            return text
+        if self.overflow == "mark":
+            return text[:width - 1] + "…" if width > 0 else ""
+        return text[:width]
+
+    def column_widths(self, table, rows: iter = None,
+                      footers: iter = None) -> List[int]:
+        """
+        Return the minimum width of each of the table's columns. The rows and
+        footers default to the table's ``data`` and ``footers``; pass them in
+        if they were already retrieved.
+        """
+        if rows is None:
+            rows = table.data
+        if footers is None:
+            footers = getattr(table, 'footers', ())
+        return TableFormatter.determine_widths(table.headers,
+                                               chain(rows, footers))
+
+    def estimate_widths(self, table, sample_size: int = 1000,
+                        rng=None) -> List[int]:
+        """
+        Estimate the minimum width of each of the table's columns from a
+        random sample of at most ``sample_size`` rows, which is independent
+        of the table size. Cells that turn out wider than the estimate are
+        handled according to the ``overflow`` policy.
+
+        :param rng: A :class:`random.Random` instance to sample with, see
+                    :func:`fancytables.TableFormatter.sample_rows`.
+        """
+        return TableFormatter.determine_widths(
+            table.headers, TableFormatter.sample_rows(table, sample_size, rng))
+
+    @staticmethod
+    def sample_rows(rows, size: int, rng=None) -> list:
+        """
+        Draw a uniform random sample of at most ``size`` rows in their
+        original order. Sized and indexable rows, such as a table, are sampled
+        by index; any other iterable is consumed entirely with reservoir
+        sampling, which only ever holds ``size`` rows. Unless a
+        :class:`random.Random` instance is given, the sample is the same for
+        equal input.
+        """
+        if rng is None:
+            from random import Random
+            rng = Random(0)
+        try:
+            count = len(rows)
+        except TypeError:
+            reservoir = []
+            for index, row in enumerate(rows):
+                if index < size:
+                    reservoir.append((index, row))
+                else:
+                    slot = rng.randrange(index + 1)
+                    if slot < size:
+                        reservoir[slot] = (index, row)
+            return [row for index, row in sorted(reservoir, key=lambda x: x[0])]
+        return [rows[i] for i in sorted(rng.sample(range(count), min(size, count)))]
+
+    @staticmethod
+    def formatter_headers(headers: List[dict], widths: List[int]) -> List[dict]:
+        """Create the *Formatter Header* s from table headers and widths."""
+        return [dict(header, width=width)
+                for header, width in zip(headers, widths)]
+
+    @staticmethod
+    def cell_text(header: dict, content) -> str:
+        """
+        Convert a cell to text, using the header's ``format`` spec if it has
+        one and the cell supports it.
+        """
+        if 'format' in header:
+            try:
+                return format(content, header['format'])
+            except (TypeError, ValueError):
+                pass
+        return str(content)
+
+    @staticmethod
+    def determine_widths(headers: List[dict], rows: iter) -> List[int]:
+        """
+        Return the minimum width of each column given by ``headers`` over the
+        given rows. Missing cells in short rows count as empty and surplus
+        cells in long rows are ignored. Numeric columns are measured with
+        :func:`fancytables.TableFormatter.bound_width` where possible.
+        """
+        columns = chain(zip_longest(*rows, fillvalue=""), repeat(()))
+        widths = []
+        for header, column in zip(headers, columns):
+            width = TableFormatter.bound_width(header, column)
+            if width is not None:
+                widths.append(max(width, len(str(header['title']))))
+            elif 'format' in header:
+                widths.append(max(chain((len(str(header['title'])),), (
+                    len(TableFormatter.cell_text(header, cell)) for cell in column))))
+            else:
+                widths.append(TableFormatter.determine_width(
+                    chain((header['title'],), column)))
+        return widths
+
+    @staticmethod
+    def bound_width(header: dict, column: list):
+        """
+        Determine the width of a numeric column from its smallest and largest
+        value only, without converting every value to text. This requires the
+        header's ``content`` to be "int", or "float" together with a
+        fixed-point ``format`` spec such as ".2f". Returns None if the column
+        can't be bounded like this, i.e. if it is empty or holds anything but
+        real numbers, including booleans and NaN.
+        """
+        content, spec = header.get('content'), header.get('format', "")
+        if not (content == "int" and spec[-1:] in ("", "d") or
+                content == "float" and spec[-1:] in ("f", "F", "%")):
+            return None
+        try:
+            low, high = min(column), max(column)
+            # NaN compares false to everything, so it is skipped by min and
+            # max unless it comes first, but can be wider than both bounds
+            if content == "float" and any(map(isnan, column)):
+                return None
+        except (TypeError, ValueError, OverflowError):
+            # empty column or cells that can't be compared to each other
+            return None
+        for bound in (low, high):
+            if not isinstance(bound, Real) or isinstance(bound, bool) \
+                    or isnan(bound):
+                return None
+        return max(len(format(low, spec)), len(format(high, spec)))
+
     @staticmethod
     def determine_width(column: iter) -> int:
         maxelmt = max(map(lambda x: str(x), column), key=len)
@@ -197,13 +412,68 @@ ASCII characters; therefore, this formatter is recommended if your project has
 issues with Unicode. This formatter can be enabled with python's new-style
 formatting, see :func:`fancytables.FancyTable.__format__` for more information."""
 
-# TODO: implement borderless formatter
-TableFormatter.Borderless = TableFormatter()
+
+class _BorderlessFormatter(TableFormatter):
+
+    # (headers, separators) of the last row_format call
+    _separator_cache = None
+
+    def header_format(self, header: dict) -> str:
+        return str(header['title']).upper()
+
+    def cell_format(self, header: dict, content) -> str:
+        if 'formatter' in header:
+            return header['formatter'](content, header['width'])
+        text = self.fit_cell(header, self.cell_text(header, content))
+        width = header['width']
+        if self.align == "c":
+            return text.center(width)
+        # plain strings are by far the most common cells, so they skip the
+        # comparatively expensive abstract base class check
+        if self.align == "r" or (self.align is None and type(content) is not str
+                                 and isinstance(content, Number)
+                                 and not isinstance(content, bool)):
+            return text.rjust(width)
+        return text.ljust(width)
+
+    def row_format(self, row: list, headers: List[dict]) -> str:
+        cells = [self.cell_format(header, cell)
+                 for header, cell in zip(headers, row)]
+        separators = self.__separators(headers) if cells else None
+        if separators is None:
+            return "  ".join(cells).rstrip()
+        line = cells[:1]
+        for separator, cell in zip(separators, cells[1:]):
+            line.append(separator)
+            line.append(cell)
+        return "".join(line).rstrip()
+
+    def __separators(self, headers: List[dict]) -> List[str]:
+        """
+        Return the separators between the columns, which set important
+        columns off from their unimportant neighbours, or None if no column is
+        important. The result is cached for the last headers list, as all
+        rows of a table are formatted with the same one.
+        """
+        cached = self._separator_cache
+        if cached is not None and cached[0] is headers:
+            return cached[1]
+        important = [header.get('important', False) for header in headers]
+        separators = None
+        if True in important:
+            separators = [" | " if left != right else "  "
+                          for left, right in zip(important, important[1:])]
+        self._separator_cache = (headers, separators)
+        return separators
+
+
+TableFormatter.Borderless = _BorderlessFormatter()
 TableFormatter.Borderless.__doc__ = """Simple borderless table formatter.
 This also capitalizes headers, which makes it akin to many command-line table
-outputs found in \\*nix system commands. This formatter can be enabled with
+outputs found in \\*nix system commands. Important columns are separated from
+other columns by a vertical bar. This formatter can be enabled with
 python's new-style formatting, see :func:`fancytables.FancyTable.__format__`
 for more information."""
 
 
-del List
+del Iterator, List
@@ -1,12 +1,31 @@
 #!usr/bin/env python3
-import logging
+from importlib import import_module
 
-from .__fancytable import FancyTable
-from .__formatters import TableFormatter
+__version__ = "0.1a2"
 
-logger = logging.getLogger(__name__)
+# public name -> private submodule that defines it. The submodules are only
+# imported on first attribute access, so ``import fancytables`` stays cheap
+# for short-lived command line invocations.
+__lazy_attributes = {
+    "FancyTable": ".__fancytable",
+    "GroupBy": ".__aggregate",
+    "LiveRenderer": ".__live",
+    "TableFormatter": ".__formatters",
+}
 
-__version__ = "0.1a2"
+__all__ = list(__lazy_attributes) + ["examples"]
+
+
+def __getattr__(name):
+    if name in __lazy_attributes:
+        value = getattr(import_module(__lazy_attributes[name], __name__), name)
+        # cache on the package so __getattr__ is not hit again for this name
+        globals()[name] = value
+        return value
+    if name == "examples":
+        return import_module(".examples", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-logger.info("fancytables is alive! v" + __version__)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
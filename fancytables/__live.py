@@ -0,0 +1,138 @@
+#!usr/bin/env python3
+import logging
+from typing import List, Tuple
+
+from .__formatters import TableFormatter
+
+logger = logging.getLogger(__package__)
+
+
+class LiveRenderer:
+    """
+    Renders a table over and over for watch-style displays, but only outputs
+    the lines that changed since the previous render. Rows are recognized as
+    unchanged by their version (see
+    :func:`fancytables.FancyTable.row_versions`), so unchanged rows are
+    neither measured nor formatted again. The whole table is only redrawn if
+    a column width or the headers change.
+
+    Example: ::
+        live = table.live()
+        while True:
+            update(table)
+            sys.stdout.write(live.render())
+            time.sleep(1)
+
+    :param table:     The table to render, which needs to provide
+                      ``row_versions`` in addition to the usual table protocol.
+    :param formatter: A formatter that implements
+                      :func:`fancytables.TableFormatter.row_format`, by default
+                      :attr:`fancytables.TableFormatter.Borderless`.
+    """
+
+    def __init__(self, table, formatter=None):
+        self.__table = table
+        self.__formatter = TableFormatter.Borderless if formatter is None \
+            else formatter
+        self.__headers = None
+        self.__widths = None
+        # output of the last render, and the measured widths and formatted
+        # line of each row by row version
+        self.__lines = []
+        self.__row_widths = {}
+        self.__row_lines = {}
+
+    def diff(self) -> Tuple[bool, List[Tuple[int, str]]]:
+        """
+        Bring the renderer up to date with the table without producing
+        terminal output. Returns whether the whole table has to be redrawn
+        and the changed lines as (line number, text) pairs, where line 0 is
+        the header line. If the table got shorter, the lines past its new end
+        are returned with None as text. On a full redraw, all lines are
+        returned.
+        """
+        table, formatter = self.__table, self.__formatter
+        headers = table.headers
+        if headers != self.__headers:
+            # cached widths include the header titles
+            self.__row_widths = {}
+
+        versions = table.row_versions
+        rows = {}
+        row_widths = {}
+        for index, version in enumerate(versions):
+            widths = self.__row_widths.get(version)
+            if widths is None:
+                rows[version] = table[index]
+                widths = TableFormatter.determine_widths(headers, [rows[version]])
+            row_widths[version] = widths
+        footers = list(getattr(table, 'footers', ()))
+        widths = [max(column) for column in zip(
+            TableFormatter.determine_widths(headers, footers),
+            *row_widths.values())]
+
+        full = widths != self.__widths or headers != self.__headers
+        if full:
+            logger.debug("Redrawing live table with widths %s", widths)
+            self.__row_lines = {}
+        formatter_headers = formatter.formatter_headers(headers, widths)
+        lines = list(formatter.format_rows(formatter_headers, ()))
+        row_lines = {}
+        for index, version in enumerate(versions):
+            line = self.__row_lines.get(version)
+            if line is None:
+                row = rows[version] if version in rows else table[index]
+                line = formatter.row_format(row, formatter_headers)
+            row_lines[version] = line
+            lines.append(line)
+        lines.extend(formatter.row_format(footer, formatter_headers)
+                     for footer in footers)
+
+        previous = self.__lines
+        self.__headers, self.__widths, self.__lines = headers, widths, lines
+        self.__row_widths, self.__row_lines = row_widths, row_lines
+        if full:
+            return True, list(enumerate(lines))
+        return False, [(number, line) for number, line in enumerate(lines)
+                       if number >= len(previous) or previous[number] != line] \
+            + [(number, None) for number in range(len(lines), len(previous))]
+
+    def render(self) -> str:
+        """
+        Return the terminal output that brings the previously rendered table
+        up to date, using ANSI escape sequences to rewrite only the changed
+        lines. This assumes that the output of the previous render was
+        written in full and the cursor was not moved since. The first render
+        outputs the whole table.
+        """
+        previous = len(self.__lines)
+        full, changes = self.diff()
+        output = []
+        if full:
+            if previous:
+                # back to the top of the old table and clear it
+                output.append("\x1b[%dF\x1b[J" % previous)
+            output.extend(line + "\n" for number, line in changes)
+            return "".join(output)
+
+        cursor = previous
+        for number, line in changes:
+            if number >= previous:
+                # appended lines; they are always the last changes
+                output.append(self.__move(cursor, previous) + line + "\n")
+                cursor = previous = number + 1
+            else:
+                output.append(self.__move(cursor, number) + "\x1b[2K" +
+                              (line if line is not None else ""))
+                cursor = number
+        output.append(self.__move(cursor, len(self.__lines)))
+        return "".join(output)
+
+    @staticmethod
+    def __move(cursor: int, line: int) -> str:
+        """Move the cursor from one line to the start of another one."""
+        if line < cursor:
+            return "\x1b[%dF" % (cursor - line)
+        if line > cursor:
+            return "\x1b[%dE" % (line - cursor)
+        return "\r"
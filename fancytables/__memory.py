@@ -0,0 +1,21 @@
+#!usr/bin/env python3
+import sys
+
+
+def deep_sizeof(obj, seen: set) -> int:
+    """
+    Return the size of an object and everything it contains in bytes, as
+    reported by :func:`sys.getsizeof`. Objects whose id is in ``seen`` are
+    skipped and all visited objects are added to it, so objects shared
+    between several calls are only counted once.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen)
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
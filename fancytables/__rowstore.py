@@ -0,0 +1,153 @@
+#!usr/bin/env python3
+import sys
+from collections.abc import MutableSequence
+from itertools import islice
+
+
+class RowStore(MutableSequence):
+    """
+    The row storage of a :class:`fancytables.FancyTable`: a list of rows that
+    supports removing rows from the front in amortized O(removed) time and
+    can have a fixed capacity, after which the oldest rows are dropped like
+    in a ring buffer.
+
+    Rows removed from the front are only overwritten and skipped by an offset
+    into the underlying list. The list is compacted once more than half of it
+    is unused, so indexing stays O(1) and memory stays within twice the
+    number of live rows.
+
+    Every row carries a version stamp, which is unique within the store and
+    renewed whenever the row is replaced. This lets renderers find the rows
+    that changed since they last looked at the table.
+    """
+
+    def __init__(self, rows: iter = (), capacity: int = None):
+        self.__rows = list(rows)
+        self.__versions = list(range(len(self.__rows)))
+        self.__clock = len(self.__rows)
+        self.__start = 0
+        self.capacity = capacity
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of rows, or None for no limit."""
+        return self.__capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int):
+        if capacity is not None and capacity < 0:
+            raise ValueError("Capacity must not be negative.")
+        self.__capacity = capacity
+        self.__trim()
+
+    @property
+    def versions(self) -> list:
+        """The version stamps of all rows, in row order."""
+        return self.__versions[self.__start:]
+
+    def memory_usage(self) -> dict:
+        """
+        Bytes used by the store itself: the "rows" list including unused
+        slots in front of the offset, and the "versions" list including the
+        stamps. The rows' contents are not included.
+        """
+        return {"rows": sys.getsizeof(self.__rows),
+                "versions": sys.getsizeof(self.__versions) +
+                sum(map(sys.getsizeof, self.__versions))}
+
+    def __stamps(self, count: int) -> list:
+        stamps = list(range(self.__clock, self.__clock + count))
+        self.__clock += count
+        return stamps
+
+    def __trim(self):
+        if self.__capacity is not None and len(self) > self.__capacity:
+            self.drop_head(len(self) - self.__capacity)
+
+    def drop_head(self, count: int):
+        """Remove the first ``count`` rows."""
+        count = min(count, len(self))
+        if count <= 0:
+            return
+        start = self.__start + count
+        # release the removed rows now rather than at the next compaction
+        self.__rows[self.__start:start] = [None] * count
+        self.__start = start
+        if self.__start > len(self.__rows) // 2:
+            self.__compact()
+
+    def __len__(self):
+        return len(self.__rows) - self.__start
+
+    def __iter__(self):
+        return islice(self.__rows, self.__start, None)
+
+    def __absolute(self, index: int) -> int:
+        if not -len(self) <= index < len(self):
+            raise IndexError("row index out of range")
+        return self.__start + index % len(self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step > 0:
+                return self.__rows[self.__start + start:self.__start + stop:step]
+            return [self.__rows[self.__start + i] for i in range(start, stop, step)]
+        return self.__rows[self.__absolute(index)]
+
+    def __setitem__(self, index, row):
+        if isinstance(index, slice):
+            self.__compact()
+            rows = list(row)
+            self.__rows[index] = rows
+            self.__versions[index] = self.__stamps(len(rows))
+            self.__trim()
+        else:
+            index = self.__absolute(index)
+            self.__rows[index] = row
+            self.__versions[index] = self.__stamps(1)[0]
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice):
+            index = self.__absolute(index) - self.__start
+            index = slice(index, index + 1)
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            self.__compact()
+            del self.__rows[index]
+            del self.__versions[index]
+        elif start == 0:
+            self.drop_head(stop)
+        elif start < stop:
+            del self.__rows[self.__start + start:self.__start + stop]
+            del self.__versions[self.__start + start:self.__start + stop]
+
+    def __compact(self):
+        del self.__rows[:self.__start]
+        del self.__versions[:self.__start]
+        self.__start = 0
+
+    def clear(self):
+        self.__rows = []
+        self.__versions = []
+        self.__start = 0
+
+    def insert(self, index: int, row):
+        self.__compact()
+        self.__rows.insert(index, row)
+        self.__versions.insert(index, self.__stamps(1)[0])
+        self.__trim()
+
+    def append(self, row):
+        self.__rows.append(row)
+        self.__versions.extend(self.__stamps(1))
+        self.__trim()
+
+    def extend(self, rows: iter):
+        rows = list(rows)
+        self.__rows.extend(rows)
+        self.__versions.extend(self.__stamps(len(rows)))
+        self.__trim()
+
+    def __repr__(self):
+        return repr(list(self))
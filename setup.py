@@ -16,6 +16,9 @@ setup(
     license="Apache 2.0",
     python_requires=">=3",
     packages=find_packages(),
+    entry_points={
+        "console_scripts": ["fancytables=fancytables.__main__:main"]
+    },
     test_suite="test_bootstrap.test_suite",
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
@@ -0,0 +1,88 @@
+import contextlib
+import io
+import unittest
+
+from fancytables import FancyTable, TableFormatter
+from fancytables.__main__ import main
+
+CSV = "name,area\nAdelaide,1295\nDarwin,112\nMelbourne,1566\n"
+
+
+def run(argv, text):
+    stdout = io.StringIO()
+    status = main(argv, stdin=io.StringIO(text), stdout=stdout)
+    return status, stdout.getvalue()
+
+
+class CliTest(unittest.TestCase):
+
+    def test_windowed(self):
+        self.assertEqual(run([], CSV), (0, "NAME       AREA\n"
+                                           "Adelaide   1295\n"
+                                           "Darwin     112\n"
+                                           "Melbourne  1566\n"))
+        # widths only come from the first row, later rows overflow
+        status, output = run(["--window", "1"], CSV)
+        self.assertEqual(output.splitlines()[3], "Melbourne  1566")
+        self.assertEqual(output.splitlines()[0], "NAME      AREA")
+
+        status, output = run(["--width", "3", "--no-header"], "a,b\n")
+        self.assertEqual(output, "1    2\na    b\n", "Fixed widths")
+
+    def test_overflow(self):
+        status, output = run(["--window", "1", "-o", "mark"], CSV)
+        self.assertEqual(output.splitlines()[3], "Melbour…  1566")
+        status, output = run(["--window", "1", "-o", "widen"], CSV + "Perth,5386\n")
+        self.assertEqual(output.splitlines()[3:], ["Melbourne  1566",
+                                                   "Perth      5386"])
+
+    def test_plain_rows(self):
+        text = CSV + "Perth,5386,extra\nHobart\n"
+        rows = [row.split(",") for row in text.splitlines()]
+        for align, width in ((None, 9), ("r", 9), ("c", 9), (None, 2)):
+            formatter = type(TableFormatter.Borderless)(align=align)
+            headers = TableFormatter.formatter_headers(
+                FancyTable(headers=rows[0]).headers, [width, width])
+            expected = "".join(line + "\n" for line in
+                               formatter.format_rows(headers, rows[1:]))
+            argv = ["--width", str(width)] + (["-a", align] if align else [])
+            self.assertEqual(run(argv, text), (0, expected),
+                             "Same output as the formatter with " + repr(argv))
+
+    def test_exact(self):
+        self.assertEqual(run(["--exact", "--window", "1"], CSV), run([], CSV),
+                         "Exact widths regardless of window size")
+
+    def test_formats(self):
+        self.assertEqual(run(["-f", "tsv"], CSV.replace(",", "\t")), run([], CSV))
+        status, output = run(["-f", "jsonl", "--exact"],
+                             '{"a": 1, "b": "x"}\n\n{"a": 100, "b": "yy"}\n')
+        self.assertEqual(output, "A    B\n  1  x\n100  yy\n",
+                         "JSON keys as headers, numbers aligned right")
+        self.assertEqual(run([], ""), (0, ""), "Empty input")
+        self.assertEqual(run(["-f", "jsonl"], "[1, 2]\n[3, null]\n"),
+                         (0, "1  2\n3\n"), "JSON arrays with titles and null")
+        self.assertEqual(run(["-f", "jsonl"], '{"a": null, "b": 1}\n')[1],
+                         "A  B\n   1\n")
+
+    def test_invalid_input(self):
+        for text in ('{"a": 1}\n[1]\n', '[1]\n{"a": 1}\n', '5\n', '[1]\n[2\n'):
+            with contextlib.redirect_stderr(io.StringIO()), \
+                    self.assertRaises(SystemExit) as context:
+                run(["-f", "jsonl"], text)
+            self.assertEqual(context.exception.code, 2, "Rejects " + repr(text))
+
+    def test_invalid_csv(self):
+        field = "x" * 200_000
+        self.assertEqual(run([], "a,b\n%s,1\n" % field)[1].splitlines()[1],
+                         field + "  1", "Fields beyond the csv default limit")
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit) as context:
+            main([], stdin=io.TextIOWrapper(io.BytesIO(b"a,b\n\xff\xfe,1\n"),
+                                            encoding="utf-8", newline=""),
+                 stdout=io.StringIO())
+        self.assertEqual(context.exception.code, 2, "Rejects invalid UTF-8")
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit) as context:
+            run(["--exact"], "a,b\nx\ry,1\n")
+        self.assertEqual(context.exception.code, 2, "Rejects csv errors")
@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 
-from fancytables import FancyTable
+from fancytables import FancyTable, TableFormatter
 
 
 class FancyTableTest(unittest.TestCase):
@@ -57,4 +58,206 @@ class FancyTableTest(unittest.TestCase):
         self.assertEqual(len(othertable.data), 2, 'Copied table was modified')
 
     def test_format(self):
-        pass
+        table = FancyTable("name", "n", data=[["foo", 1], ["quux", 200]])
+        self.assertEqual(TableFormatter.Borderless(table),
+                         "NAME  N\nfoo     1\nquux  200", "Borderless format")
+        headers = TableFormatter.formatter_headers(table.headers, [2, 2])
+        self.assertEqual(list(TableFormatter.Borderless.format_rows(
+            headers, iter([["a", "b"]]))), ["NAME  N", "a   b"],
+            "Streamed rows with fixed widths")
+
+    def test_estimate_widths(self):
+        table = FancyTable({'title': 'n', 'content': 'int'},
+                           {'title': 'f', 'content': 'float', 'format': '.1f'},
+                           data=[[i, i / 3] for i in range(-50, 1000)])
+        formatter = TableFormatter.Borderless
+        self.assertEqual(formatter.column_widths(table), [3, 5],
+                         "Widths from numeric bounds")
+        self.assertEqual(formatter.estimate_widths(table, sample_size=len(table)),
+                         [3, 5], "Full sample is exact")
+        self.assertLessEqual(len(TableFormatter.sample_rows(table, 10)), 10)
+        nan = float("nan")
+        for content, spec, column, width in (
+                ("int", "", ["10", "9", "100"], 3), ("int", "", [True, 10], 4),
+                ("float", ".0f", [nan, 1e10], 11), ("float", ".0f", [5.0, nan], 3)):
+            header = {'title': "", 'content': content, 'format': spec}
+            self.assertIsNone(TableFormatter.bound_width(header, column))
+            self.assertEqual(TableFormatter.determine_widths(
+                [header], [[cell] for cell in column]), [width],
+                "Fall back to measuring " + repr(column))
+        self.assertEqual(TableFormatter.sample_rows(iter(range(5)), 10),
+                         list(range(5)), "Reservoir smaller than sample size")
+
+        headers = TableFormatter.formatter_headers(table.headers, [2, 2])
+        overflowing = [[12345, 0.25]]
+        for policy, line in (("truncate", "12  0."), ("mark", "1…  0…"),
+                             (None, "12345  0.2")):
+            formatter = type(TableFormatter.Borderless)(overflow=policy)
+            self.assertEqual(list(formatter.format_rows(headers, overflowing))[1],
+                             line, "Overflow policy " + str(policy))
+        self.assertRaises(ValueError, TableFormatter, overflow="explode")
+
+        estimating = type(TableFormatter.Borderless)(sample_size=len(table))
+        self.assertEqual(estimating(table), TableFormatter.Borderless(table),
+                         "Estimating from a full sample")
+        estimating = type(TableFormatter.Borderless)(sample_size=5, overflow="mark")
+        with mock.patch.object(FancyTable, "data", property(
+                lambda table: self.fail("data copied"))):
+            lines = estimating.lines(table)
+            self.assertEqual(next(lines), "N    F")
+            self.assertEqual(len(list(lines)), len(table),
+                             "Streamed without copying the data")
+        self.assertEqual(list(table.iter_rows())[0], [-50, -50 / 3])
+        self.assertRaises(ValueError, TableFormatter, sample_size=0)
+
+    def test_aggregation(self):
+        table = FancyTable("city", "area", "rain",
+                           data=[["a", 10, 1.5], ["b", 5, 2.0], ["a", 20, None]])
+        expected = [["a", 2, 30, 1.5], ["b", 1, 5, 2.0]]
+        grouped = table.group_by("city").agg(count="area", sum=1, max="rain")
+        self.assertEqual(grouped.data, expected, "Group by")
+        self.assertEqual([h['important'] for h in grouped.headers],
+                         [True, False, False, False], "Key columns are important")
+        self.assertEqual(grouped.headers[1]['title'], "count(area)")
+        self.assertEqual(TableFormatter.Borderless(grouped).splitlines()[:2],
+                         ["CITY | COUNT(AREA)  SUM(AREA)  MAX(RAIN)",
+                          "a    |           2         30        1.5"],
+                         "Key columns are set off in the output")
+        with mock.patch("fancytables.__aggregate._numpy", lambda: None):
+            self.assertEqual(table.group_by(0).agg(count="area", sum=1, max="rain")
+                             .data, expected, "Group by without numpy")
+
+        table_large = FancyTable("k", "int", "mixed", "float",
+                                 data=[["a", 2 ** 62, 1, 0.5], ["a", 2 ** 62, 2.5, 0.25],
+                                       ["b", -3, 4, 1.0]])
+        specs = dict(sum=["int", "mixed", "float"], min=["int", "mixed", "float"],
+                     max="float", mean="float", count="int")
+        result = table_large.group_by("k").agg(**specs).data
+        with mock.patch("fancytables.__aggregate._numpy", lambda: None):
+            self.assertEqual(table_large.group_by("k").agg(**specs).data, result,
+                             "Both reduction paths agree")
+        self.assertEqual(result[0][1], 2 ** 63, "No integer overflow")
+        self.assertEqual(result[0][5], 1)
+        self.assertIs(type(result[0][5]), int, "Integers in mixed columns are kept")
+        self.assertEqual(result[0][3], 0.75)
+
+        self.assertRaises(ValueError, lambda: table.group_by("city").agg(median="area"))
+        self.assertRaises(KeyError, lambda: table.group_by("nope"))
+
+        table.summarize(sum="area", mean=["area", "rain"])
+        self.assertEqual(table.footers, [["sum", 35, ""], ["mean", 35 / 3, 1.75]],
+                         "Summary footers")
+        table += ["c", 1, 0.5]
+        self.assertEqual(table.footers[0], ["sum", 36, ""],
+                         "Footers follow the data")
+        self.assertEqual(len(TableFormatter.Borderless(table).splitlines()), 7)
+        from fancytables.__fancytable import aggregate
+        with mock.patch("fancytables.__fancytable.aggregate",
+                        side_effect=aggregate) as counted:
+            TableFormatter.Borderless(table)
+        self.assertEqual(counted.call_count, 1, "One aggregation per render")
+        del table.footers
+        self.assertEqual(table.footers, [])
+
+        table.summarize(sum=["city", "area"], min="city", mean="rain")
+        table += ["d", "n/a", None]
+        self.assertEqual(table.footers, [[0, 36, ""], ["a", "", ""],
+                                         ["mean", "", 4 / 3]],
+                         "Cells that can't be aggregated are skipped")
+        self.assertEqual(len(TableFormatter.Borderless(table).splitlines()), 9)
+        empty = FancyTable("a", "b")
+        empty.summarize(sum="b", mean="b")
+        self.assertEqual(empty.footers, [["sum", 0], ["mean", ""]], "Empty table")
+        empty += [["x", None]]
+        self.assertEqual(empty.footers, [["sum", 0], ["mean", ""]],
+                         "Only None cells, like an empty table")
+
+    def test_deletion(self):
+        table = FancyTable("n", data=[[i] for i in range(10)])
+        del table[0]
+        del table[-1]
+        del table[3:5]
+        self.assertEqual([row[0] for row in table.data], [1, 2, 3, 6, 7, 8])
+        table.drop_head(2)
+        self.assertEqual(table[0], [3], "Indexing after dropping rows")
+        table.keep_last(2)
+        self.assertEqual(table.data, [[7], [8]])
+        table.keep_last(5)
+        self.assertEqual(len(table), 2, "Keeping more rows than present")
+        self.assertRaises(ValueError, lambda: table.drop_head(-1))
+
+        table = FancyTable("n", data=[[i] for i in range(10)])
+        part = table[2:8:2]
+        self.assertIsInstance(part, FancyTable, "Slices are tables")
+        self.assertEqual(part.data, [[2], [4], [6]])
+        part += [100]
+        self.assertEqual(len(table), 10, "Slices are copies")
+        self.assertEqual((table - 3).data[-1], [6])
+
+    def test_capacity(self):
+        table = FancyTable("n", capacity=3)
+        for i in range(100):
+            table += [i]
+        self.assertEqual(table.data, [[97], [98], [99]], "Ring buffer")
+        table = table + [[100], [101]]
+        self.assertEqual(table.data, [[99], [100], [101]])
+        self.assertEqual(table.capacity, 3, "Copies keep the capacity")
+        table.capacity = 1
+        self.assertEqual(table.data, [[101]], "Lowering the capacity")
+        table.data = [[1], [2]]
+        self.assertEqual(table.data, [[2]], "Setting data respects capacity")
+
+    def test_inplace_adding(self):
+        table = FancyTable("a")
+        alias = table
+        table += [1]
+        self.assertIs(table, alias, "+= modifies the table in place")
+        self.assertEqual(alias.data, [[1]])
+
+    def test_memory_usage(self):
+        table = FancyTable("a", "b", data=[["x" * 1000, i] for i in range(10)])
+        shallow = table.memory_usage()
+        deep = table.memory_usage(deep=True)
+        self.assertEqual(set(deep["columns"]), {"a", "b"})
+        self.assertGreater(deep["columns"]["a"], 1000,
+                           "Deep usage includes cell values")
+        self.assertLess(deep["columns"]["a"], 2000,
+                        "Shared cell values are counted once")
+        self.assertLess(shallow["total"], deep["total"])
+        self.assertEqual(deep["total"], sum(deep["columns"].values()) +
+                         deep["rows"] + deep["versions"] + deep["headers"] +
+                         deep["summaries"], "Total adds up")
+        table.keep_last(1)
+        self.assertLess(table.memory_usage(deep=True)["columns"]["b"],
+                        deep["columns"]["b"], "Dropped rows are released")
+
+    def test_combining(self):
+        first = FancyTable("k", "v", data=[[1, "a"], [4, "b"], [9, "c"]])
+        second = FancyTable("k", "v", data=[[2, "d"], [4, "e"]])
+        third = FancyTable("k", "v")
+        combined = FancyTable.concat([first, second, third])
+        self.assertEqual([row[0] for row in combined.data], [1, 4, 9, 2, 4])
+        merged = FancyTable.merge_sorted([first, second, third], key="k")
+        self.assertEqual(merged.data, [[1, "a"], [2, "d"], [4, "b"], [4, "e"],
+                                       [9, "c"]], "Stable k-way merge")
+        merged += [10, "f"]
+        self.assertEqual(len(first), 3, "Combined tables are copies")
+
+        self.assertEqual([row[1] for row in FancyTable.merge_sorted_rows(
+            [first[::-1], second[::-1]], key=0, reverse=True)],
+            ["c", "b", "e", "d", "a"], "Lazy merge of descending tables")
+        self.assertRaises(ValueError, lambda: FancyTable.concat(
+            [first, FancyTable("k", "w")]))
+        self.assertRaises(ValueError, lambda: FancyTable.concat([]))
+
+    def test_header_formatting(self):
+        table = FancyTable({'title': 'price', 'important': False,
+                            'formatter': lambda x, w: f"{x:>{w}.2f}"},
+                           {'title': 'n', 'important': False, 'format': ">3"},
+                           data=[[1.5, 1]])
+        self.assertEqual(TableFormatter.Borderless(table),
+                         "PRICE  N\n 1.50    1",
+                         "Value formatters do not apply to titles")
+        table = FancyTable({'title': 5, 'important': False}, data=[["ab"]])
+        self.assertEqual(TableFormatter.Borderless(table), "5\nab",
+                         "Non-string titles")
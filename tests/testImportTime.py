@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+
+# cumulative microseconds that ``import fancytables`` may take on its own
+IMPORT_BUDGET_US = 20_000
+
+
+def import_times(statement):
+    """Run ``statement`` in a fresh interpreter with ``-X importtime`` and
+    return a dict mapping module names to cumulative import time in µs."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_import_budget(self):
+        times = import_times("import fancytables")
+        self.assertIn("fancytables", times)
+        self.assertLess(times["fancytables"], IMPORT_BUDGET_US,
+                        "Package import exceeds the startup budget")
+
+    def test_lazy_submodules(self):
+        times = import_times("import fancytables")
+        self.assertEqual([name for name in times
+                          if name.startswith("fancytables.")], [],
+                         "Submodules are not imported eagerly")
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, fancytables; fancytables.FancyTable;"
+             "print('fancytables.__fancytable' in sys.modules)"],
+            capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "True",
+                         "Submodule is imported on first attribute access")
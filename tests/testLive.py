@@ -0,0 +1,93 @@
+import re
+import unittest
+
+from fancytables import FancyTable, TableFormatter
+
+
+class Terminal:
+    """Minimal terminal that understands the escape sequences used by
+    LiveRenderer, to check that the output adds up to the right screen."""
+
+    def __init__(self):
+        self.lines = [""]
+        self.row = 0
+
+    def write(self, text):
+        for token in re.findall(r"\x1b\[\d*[A-Za-z]|.|\n", text, re.S):
+            if token == "\n":
+                self.row += 1
+                if self.row == len(self.lines):
+                    self.lines.append("")
+            elif token == "\r":
+                pass
+            elif token.startswith("\x1b["):
+                count, command = int(token[2:-1] or 1), token[-1]
+                if command == "F":
+                    self.row -= count
+                elif command == "E":
+                    self.row += count
+                elif command == "J":
+                    del self.lines[self.row:]
+                    self.lines.append("")
+                elif command == "K":
+                    self.lines[self.row] = ""
+            else:
+                self.lines[self.row] += token
+
+    @property
+    def screen(self):
+        return "\n".join(self.lines).rstrip("\n")
+
+
+class LiveRendererTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = FancyTable("name", "n", data=[["a", 1], ["b", 2], ["c", 3]])
+        self.live = self.table.live()
+        self.terminal = Terminal()
+
+    def assertScreen(self):
+        self.terminal.write(self.live.render())
+        self.assertEqual(self.terminal.screen,
+                         TableFormatter.Borderless(self.table))
+
+    def test_diff(self):
+        self.assertEqual(self.live.diff()[0], True, "First render is full")
+        self.assertEqual(self.live.diff(), (False, []), "Nothing changed")
+        self.table.set_cell(1, "n", 7)
+        self.assertEqual(self.live.diff(), (False, [(2, "b     7")]),
+                         "Only the changed row")
+        del self.table[1:]
+        self.assertEqual(self.live.diff(), (False, [(2, None), (3, None)]),
+                         "Removed lines")
+
+    def test_incremental(self):
+        self.assertScreen()
+        self.table.set_cell(1, "n", 7)
+        self.assertScreen()
+        self.table.set_cell(2, 0, "d")
+        self.assertScreen()
+        self.table += ["e", 1]
+        self.assertScreen()
+        self.table.drop_head(2)
+        self.assertScreen()
+
+    def test_redraw(self):
+        self.assertScreen()
+        self.table[0] = ["a much longer name", 1]
+        full, lines = self.live.diff()
+        self.assertTrue(full, "Width change redraws the table")
+        self.assertEqual(len(lines), 4)
+        self.table[0] = ["shorter again", 1]
+        self.assertScreen()
+        self.table.headers = ["city", "n"]
+        self.assertScreen()
+
+    def test_versions(self):
+        versions = self.table.row_versions
+        self.table.set_cell(0, 1, 10)
+        self.assertNotEqual(self.table.row_versions[0], versions[0])
+        self.assertEqual(self.table.row_versions[1:], versions[1:])
+        self.table.data = [["x", 1]]
+        self.assertNotIn(self.table.row_versions[0], versions,
+                         "Versions are never reused")